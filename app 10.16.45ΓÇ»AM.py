@@ -27,12 +27,13 @@ Disclaimer:
 """
 
 from datetime import datetime
+import functools
 import os
-import sqlite3
 
 from flask import Flask, request
 
 from chatbot import get_bot_response
+from database import get_db_connection
 from journal import analyze_emotion
 from mood_plot import plot_mood_trend
 from suggestions import get_suggestion
@@ -43,21 +44,7 @@ from suggestions import get_suggestion
 # call can be reinstated here.
 
 
-def get_db_connection() -> sqlite3.Connection:
-    """Return a connection to the local SQLite database.
-
-    If the database file does not yet exist, it will be created
-    automatically. We also enable row_factory so rows behave like
-    dictionaries when accessed.
-
-    Returns:
-        sqlite3.Connection: A connection object to the SQLite database.
-    """
-    conn = sqlite3.connect("database.db")
-    conn.row_factory = sqlite3.Row
-    return conn
-
-
+@functools.cache
 def init_db() -> None:
     """Create the journal_entries table if it does not already exist."""
     conn = get_db_connection()
@@ -77,19 +64,13 @@ def init_db() -> None:
     conn.close()
 
 
+@functools.cache
 def ensure_static_dir() -> None:
     """Ensure the static directory exists for storing images."""
     if not os.path.isdir("static"):
         os.makedirs("static")
 
 
-# Initialize the database and static directory at import time so that the
-# application is ready to store data as soon as it starts. The calls
-# happen once when this module is imported.
-init_db()
-ensure_static_dir()
-
-
 app = Flask(__name__)
 
 
@@ -150,6 +131,7 @@ def journal():
     Returns:
         str: Rendered HTML content.
     """
+    init_db()
     message = ""
     suggestion = ""
     detected_mood = ""
@@ -207,6 +189,8 @@ def mood():
     Returns:
         str: Rendered HTML content.
     """
+    init_db()
+    ensure_static_dir()
     # Generate the chart; the function will save the file into the static folder.
     chart_path = plot_mood_trend()
     content = []
@@ -9,10 +9,11 @@ Run with: streamlit run app.py
 import streamlit as st
 from chatbot import generate_reply, detect_intent_and_emotion
 from datetime import datetime
-from database import init_db, get_db_connection
+from database import init_db, get_reader, get_writer, MOOD_VALUES, WRITE_LOCK
 from journal import analyze_emotion
-from suggestions import get_suggestion
-from mood_plot import plot_mood_trend
+
+# Number of recent chat messages rendered on every rerun
+DISPLAY_K = 30
 
 st.set_page_config(page_title="MindMate", page_icon="🧠", layout="centered")
 
@@ -38,7 +39,14 @@ if "last_achievement" not in st.session_state:
 
 
 if page == "Chat":
-    for m in st.session_state.messages:
+    # Only the most recent turns are rendered on each rerun; older ones are
+    # rendered on demand so long sessions stay responsive.
+    earlier = st.session_state.messages[:-DISPLAY_K]
+    if earlier and st.toggle(f"Show earlier messages ({len(earlier)})", value=False, key="show_earlier"):
+        for m in earlier:
+            with st.chat_message(m["role"]):
+                st.markdown(m["content"])
+    for m in st.session_state.messages[-DISPLAY_K:]:
         with st.chat_message(m["role"]):
             st.markdown(m["content"])
 
@@ -58,22 +66,24 @@ if page == "Chat":
 
         st.session_state.messages.append({"role": "user", "content": prompt})
         # Log chat mood signal
-        with get_db_connection() as conn:
-            conn.execute(
-                "INSERT INTO mood_signals (date, source, content, mood, polarity) VALUES (?, ?, ?, ?, ?)",
+        mood_value = MOOD_VALUES.get(ctx["emotion"], 0)
+        with WRITE_LOCK:
+            get_writer().execute(
+                "INSERT INTO mood_signals (date, source, content, mood, polarity, mood_value) VALUES (?, ?, ?, ?, ?, ?)",
                 (
-                    datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    datetime.now().isoformat(sep=" ", timespec="seconds"),
                     "chat",
                     prompt,
                     ctx["emotion"],
-                    1.0 if ctx["emotion"] == "positive" else (-1.0 if ctx["emotion"] == "negative" else 0.0),
+                    float(mood_value),
+                    mood_value,
                 ),
             )
         with st.chat_message("user"):
             st.markdown(prompt)
         # Build brief history for LLM context
         history = st.session_state.messages[-10:]
-        base = generate_reply(prompt, history, style=reply_style)
+        base = generate_reply(prompt, history, style=reply_style, ctx=ctx)
 
         # Light short-term memory: weave recent context into the assistant reply
         # Throttle memory to avoid repetition; only show when changing topics/emotions
@@ -110,29 +120,41 @@ if page == "Chat":
             st.markdown(reply)
 
 elif page == "Journal":
+    from suggestions import get_suggestion
+
     st.subheader("Journal Entry")
     with st.form("journal_form", clear_on_submit=True):
         entry = st.text_area("Write your thoughts", placeholder="What's on your mind today?", height=150)
         submitted = st.form_submit_button("Save Entry")
         if submitted and entry.strip():
             mood, polarity = analyze_emotion(entry)
-            with get_db_connection() as conn:
-                conn.execute(
-                    "INSERT INTO journal_entries (date, content, mood, polarity) VALUES (?, ?, ?, ?)",
-                    (datetime.now().strftime("%Y-%m-%d %H:%M:%S"), entry, mood, polarity),
-                )
-                conn.execute(
-                    "INSERT INTO mood_signals (date, source, content, mood, polarity) VALUES (?, ?, ?, ?, ?)",
-                    (datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "journal", entry, mood, polarity),
-                )
+            ts = datetime.now().isoformat(sep=" ", timespec="seconds")
+            with WRITE_LOCK:
+                conn = get_writer()
+                # One immediate transaction for both rows; the mood signal is
+                # copied from the journal row just inserted.
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    conn.execute(
+                        "INSERT INTO journal_entries (date, content, mood, polarity) VALUES (?, ?, ?, ?)",
+                        (ts, entry, mood, polarity),
+                    )
+                    conn.execute(
+                        "INSERT INTO mood_signals (date, source, content, mood, polarity, mood_value) "
+                        "SELECT date, 'journal', content, mood, polarity, ? FROM journal_entries WHERE id = last_insert_rowid()",
+                        (MOOD_VALUES.get(mood, 0),),
+                    )
+                    conn.execute("COMMIT")
+                except Exception:
+                    conn.execute("ROLLBACK")
+                    raise
             st.success("Entry saved!")
             st.info(f"Detected mood: {mood} | Polarity: {polarity:.2f}")
             st.write(get_suggestion(mood))
 
     # Recent entries preview
-    conn = get_db_connection()
-    rows = conn.execute("SELECT date, mood, content FROM journal_entries ORDER BY date DESC LIMIT 5").fetchall()
-    conn.close()
+    with get_reader() as conn:
+        rows = conn.execute("SELECT date, mood, content FROM journal_entries ORDER BY date DESC LIMIT 5").fetchall()
     if rows:
         st.divider()
         st.caption("Recent entries")
@@ -142,38 +164,15 @@ elif page == "Journal":
         st.caption("No entries yet. Your first one will appear here.")
 
 elif page == "Mood Trends":
+    # Imported lazily: pulls in matplotlib, which Chat-only sessions never need
+    from mood_plot import plot_filtered_mood_trend, plot_mood_trend
+
     st.subheader("Mood Trend Over Time")
     # Optional source filtering by user choice
     if source_filter and set(source_filter) != {"chat", "journal"}:
-        # On-the-fly filter: generate a filtered trend image by reading DB directly
-        # For simplicity, reuse plot_mood_trend() when all sources; otherwise render inline using pandas
-        import sqlite3
-        import matplotlib.pyplot as plt
-        import os
-
-        conn = sqlite3.connect("database.db")
-        cur = conn.cursor()
-        qmarks = ",".join(["?"] * len(source_filter)) or "?"
-        cur.execute(f"SELECT date, mood FROM mood_signals WHERE source IN ({qmarks}) ORDER BY date ASC", source_filter)
-        rows = cur.fetchall()
-        conn.close()
-
-        if rows:
-            dates = [r[0] for r in rows]
-            vals = [1 if r[1].lower()=="positive" else (-1 if r[1].lower()=="negative" else 0) for r in rows]
-            plt.figure(figsize=(8, 4))
-            plt.plot(dates, vals, marker="o", linestyle="-", linewidth=1.5)
-            plt.title("Mood Trend (Filtered)")
-            plt.xlabel("Date")
-            plt.ylabel("Mood Value (positive=1, neutral=0, negative=-1)")
-            plt.xticks(rotation=45)
-            plt.grid(True, linestyle="--", linewidth=0.5)
-            plt.tight_layout()
-            out = os.path.join("static", "mood_trend_filtered.png")
-            os.makedirs("static", exist_ok=True)
-            plt.savefig(out)
-            plt.close()
-            st.image(out, caption="Mood trend (filtered)", use_column_width=True)
+        path = plot_filtered_mood_trend(source_filter)
+        if path:
+            st.image(path, caption="Mood trend (filtered)", use_column_width=True)
         else:
             st.info("No mood data for the selected source(s). Try chatting or adding a journal entry.")
     else:
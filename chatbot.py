@@ -2,9 +2,11 @@
 Simple emotion-aware chatbot for MindMate.
 
 Public API:
-- get_response(text: str) -> str
+- get_response(text: str, ctx: dict | None = None) -> str
 """
-from textblob import TextBlob
+from xml.etree import ElementTree
+import functools
+import importlib.util
 import re
 import os
 import json
@@ -16,13 +18,231 @@ try:
 except Exception:  # pragma: no cover
     OpenAI = None  # type: ignore
 
+# Optional orjson for the Ollama request/response bodies; stdlib json otherwise
+try:
+    import orjson  # type: ignore
+    _json_dumps, _json_loads = orjson.dumps, orjson.loads
+except Exception:  # pragma: no cover
+    _json_dumps, _json_loads = (lambda obj: json.dumps(obj).encode("utf-8")), json.loads
+
+# Optional Aho-Corasick matcher for intent phrases; falls back to substring scans
+try:
+    import ahocorasick  # type: ignore
+except Exception:  # pragma: no cover
+    ahocorasick = None  # type: ignore
+
 POS_THRESHOLD = 0.3
 NEG_THRESHOLD = -0.3
 
+# Terms whose negation flips the detected emotion (e.g., "not happy" -> negative)
+POSITIVE_TERMS = [
+    "happy", "good", "great", "excited", "okay", "ok", "fine", "positive", "calm", "content"
+]
+NEGATIVE_TERMS = [
+    "sad", "down", "depressed", "anxious", "angry", "stressed", "worried", "upset"
+]
+
+
+def _negation_re(terms: list[str]) -> re.Pattern:
+    # Patterns: not X, not so X, not that X, not feeling X, don't feel X, do not feel X, no longer X
+    alt = "|".join(map(re.escape, terms))
+    return re.compile(
+        rf"\b(?:not (?:feeling )?|don't feel |do not feel )(?:so |that )?(?:{alt})\b"
+        rf"|\bno longer (?:feel(?:ing)? )?(?:{alt})\b"
+    )
+
+
+_NEG_POS_RE = _negation_re(POSITIVE_TERMS)
+_NEG_NEG_RE = _negation_re(NEGATIVE_TERMS)
+_Q_WORDS = frozenset({
+    "what", "why", "how", "when", "where", "who", "can", "should", "could", "would", "is", "are", "do", "does"
+})
+
+# Intent phrases in priority order: more specific intents win when several match.
+INTENT_PHRASES: list[tuple[str, list[str]]] = [
+    ("achievement", [
+        "i made", "i built", "i created", "i achieved", "i accomplished",
+        "promotion", "got hired", "won", "passed", "nailed it",
+        "big achievement", "proud of", "shipped"
+    ]),
+    ("gratitude", ["thank you", "thanks", "appreciate it", "grateful"]),
+    ("apology", ["sorry", "apologies", "my fault", "apologize"]),
+    ("anger", ["angry", "mad", "furious", "pissed", "rage"]),
+    ("tiredness", ["tired", "exhausted", "drained", "fatigued", "sleepy", "burnt out", "burned out"]),
+    ("overwhelm", ["overwhelmed", "too much", "can’t handle", "cant handle", "overloaded"]),
+    ("confusion", ["confused", "don’t know", "dont know", "unsure", "uncertain"]),
+    ("loneliness", ["lonely", "alone", "isolated"]),
+    ("anxiety", ["anxious", "anxiety", "worried", "stress", "stressed"]),
+    ("journal", ["journal", "write", "diary", "journaling", "notes"]),
+    ("breathing", ["breathe", "breathing", "grounding", "relax", "calm down"]),
+    ("capability", ["who are you", "what are you", "what can you do", "help me", "how can you help", "what can i do"]),
+    ("greet", ["hello", "hi", "hey", "good morning", "good evening", "good afternoon"]),
+]
+
+
+def _build_intent_automaton():
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    seen = set()
+    for priority, (intent, phrases) in enumerate(INTENT_PHRASES):
+        for phrase in phrases:
+            # Keep the highest-priority intent if a phrase is listed twice
+            if phrase not in seen:
+                seen.add(phrase)
+                automaton.add_word(phrase, (priority, intent))
+    automaton.make_automaton()
+    return automaton
+
+
+_INTENT_AUTOMATON = _build_intent_automaton()
+
+
+def _match_intent(text: str) -> str:
+    """Return the highest-priority intent whose phrase occurs in text."""
+    if _INTENT_AUTOMATON is None:
+        for intent, phrases in INTENT_PHRASES:
+            if _contains_any(text, phrases):
+                return intent
+        return "none"
+    best = None
+    for _, (priority, intent) in _INTENT_AUTOMATON.iter(text):
+        if best is None or priority < best[0]:
+            best = (priority, intent)
+            if priority == 0:
+                break
+    return best[1] if best else "none"
+
+
+# Pattern's emoticon table, which TextBlob's PatternAnalyzer scores
+# alongside the lexicon: (polarity, faces)
+_EMOTICON_FACES = (
+    (+1.00, ("<3", "♥")),
+    (+1.00, (">:D", ":-D", ":D", "=-D", "=D", "X-D", "x-D", "XD", "xD", "8-D")),
+    (+0.75, (">:P", ":-P", ":P", ":-p", ":p", ":-b", ":b", ":c)", ":o)", ":^)")),
+    (+0.50, (">:)", ":-)", ":)", "=)", "=]", ":]", ":}", ":>", ":3", "8)", "8-)")),
+    (+0.25, (">;]", ";-)", ";)", ";-]", ";]", ";D", ";^)", "*-)", "*)")),
+    (+0.05, (">:o", ":-O", ":O", ":o", ":-o", "o_O", "o.O", "°O°", "°o°")),
+    (-0.25, (">:/", ":-/", ":/", ":\\", ">:\\", ":-.", ":-s", ":s", ":S", ":-S", ">.>")),
+    (-0.75, (">:[", ":-(", ":(", "=(", ":-[", ":[", ":{", ":-<", ":c", ":-c", "=/")),
+    (-1.00, (":'(", ":'''(", ";'(")),
+)
+
+# Lowercased face -> polarity; the first group listing a face wins. All-letter
+# faces ("XD") are skipped, as TextBlob only checks non-alphabetic tokens.
+_EMOTICONS: dict[str, float] = {}
+for _p, _faces in _EMOTICON_FACES:
+    for _face in _faces:
+        if not _face.isalpha():
+            _EMOTICONS.setdefault(_face.lower(), _p)
+
+
+
+def _emoticon_pattern(face: str) -> str:
+    # TextBlob lets characters be space-separated (": )"), and reads a face
+    # whose tail looks like an abbreviation plus period (":P.", "o.O.") as
+    # one unscored token; "..." is always split off.
+    pattern = " ?".join(map(re.escape, face))
+    if re.fullmatch(r"(?:[A-Za-z]\.)+", face.lstrip(".,;:!?()[]{}`'\"@#$^&*+-|=~_") + "."):
+        pattern += r"(?!\.(?!\.\.))"
+    return pattern
+
+
+# Split the way TextBlob's tokenizer does: "don't" -> "do n ' t", "i'm" -> "i ' m".
+# Emoticons are kept whole and, like TextBlob, matched case-sensitively.
+_WORD_RE = re.compile(
+    "(?:"
+    + "|".join(
+        _emoticon_pattern(face)
+        for face in sorted((f for _, fs in _EMOTICON_FACES for f in fs if not f.isalpha()), key=len, reverse=True)
+    )
+    + r")(?![A-Za-z0-9])"
+    + r"|(?i:[a-z0-9]+?(?=n't\b)|[a-z0-9]+(?:[-*][a-z0-9]+)*)|\.\.\.|!"
+)
+_NEGATIONS = frozenset({"no", "not", "never"})
+
+
+def _load_sentiment_lexicon() -> dict[str, tuple[float, float, bool]]:
+    """Load TextBlob's en-sentiment.xml once into form -> (polarity, intensity, modifier).
+
+    Scores are averaged per part-of-speech and then across parts-of-speech,
+    as TextBlob's PatternAnalyzer does when no POS tags are supplied.
+    Adjectives also yield their "-ly" adverb ("terrible" -> "terribly"), and
+    any word with an adverb (RB) sense is flagged as a modifier. Scores stay
+    Python floats so sums land exactly where TextBlob's do on the thresholds.
+    """
+    spec = importlib.util.find_spec("textblob")
+    path = os.path.join(spec.submodule_search_locations[0], "en", "en-sentiment.xml")
+    senses: dict[str, dict[str | None, list[tuple[float, float]]]] = {}
+    for w in ElementTree.parse(path).getroot().iter("word"):
+        form = w.attrib.get("form")
+        if form:
+            senses.setdefault(form, {}).setdefault(w.attrib.get("pos"), []).append(
+                (float(w.attrib.get("polarity", 0.0)), float(w.attrib.get("intensity", 1.0)))
+            )
+    scores: dict[str, dict[str | None, tuple[float, float]]] = {}
+    for form, by_pos in senses.items():
+        per_pos = {pos: tuple(sum(v) / len(v) for v in zip(*pis)) for pos, pis in by_pos.items()}
+        per_pos[None] = tuple(sum(v) / len(v) for v in zip(*per_pos.values()))
+        scores[form] = per_pos
+    for form, per_pos in list(scores.items()):
+        if "JJ" in per_pos:
+            stem = form[:-1] + "i" if form.endswith("y") else form
+            stem = stem[:-2] if stem.endswith("le") else stem
+            adverb = scores.setdefault(stem + "ly", {})
+            adverb["RB"] = adverb[None] = per_pos["JJ"]
+    return {form: (*per_pos[None], "RB" in per_pos) for form, per_pos in scores.items()}
+
+
+LEXICON = _load_sentiment_lexicon()
+
 
 def get_emotion(text: str) -> str:
-    blob = TextBlob(text)
-    polarity = blob.sentiment.polarity
+    return _emotion_for(text.strip())
+
+
+@functools.lru_cache(maxsize=1024)
+def _emotion_for(text: str) -> str:
+    # Mirrors PatternAnalyzer.assessments: a modifier ("very") scales the next
+    # known word instead of being scored on its own, and a negation carries
+    # across modifiers and one-letter words ("not very good", "not a good").
+    chunks: list[list] = []  # [polarity, intensity, negated]
+    modifier = None
+    negation = False
+    for tok in _WORD_RE.findall(text):
+        tok = tok.lower().replace(" ", "")
+        entry = LEXICON.get(tok)
+        if entry is not None:
+            p, i, is_modifier = entry
+            if modifier is None:
+                chunks.append([p, i, False])
+            else:
+                chunks[-1][0] = max(-1.0, min(p * chunks[-1][1], 1.0))
+                chunks[-1][1] = i
+            if negation:
+                chunks[-1][1] = 1.0 / chunks[-1][1]
+                chunks[-1][2] = True
+            modifier = tok if is_modifier else None
+            negation = tok in _NEGATIONS
+            continue
+        if tok in _NEGATIONS:
+            negation = True
+        elif negation and len(tok) > 1:
+            negation = False
+        if negation and modifier is not None and modifier.endswith("ly"):
+            # "really not good"
+            chunks[-1][2] = True
+            negation = False
+        elif modifier is not None and len(tok) > 2:
+            modifier = None
+        if tok == "!" and chunks:
+            chunks[-1][0] = max(-1.0, min(chunks[-1][0] * 1.25, 1.0))
+        elif tok in _EMOTICONS:
+            chunks.append([_EMOTICONS[tok], 1.0, False])
+    if not chunks:
+        return "neutral"
+    # "not good" = slightly bad, "not bad" = slightly good
+    polarity = sum(p * -0.5 if n else p for p, _, n in chunks) / len(chunks)
     if polarity > POS_THRESHOLD:
         return "positive"
     if polarity < NEG_THRESHOLD:
@@ -34,10 +254,16 @@ def _contains_any(text: str, phrases: list[str]) -> bool:
     return any(p in text for p in phrases)
 
 
+_FIRST_WORD_RE = re.compile(r"\w+")
+
+
 def _question_like(text: str) -> bool:
     if "?" in text:
         return True
-    return bool(re.match(r"\b(what|why|how|when|where|who|can|should|could|would|is|are|do|does)\b", text))
+    # Leading word-character run, like the old \b(...)\b match: "what's",
+    # "how\nare you" and "how-to" probe with their first word
+    first = _FIRST_WORD_RE.match(text.lstrip())
+    return first is not None and first.group() in _Q_WORDS
 
 
 def detect_intent_and_emotion(user_input: str) -> dict:
@@ -48,81 +274,44 @@ def detect_intent_and_emotion(user_input: str) -> dict:
     capability, greet, none
     """
     text = user_input.lower().strip()
+    # Fresh dict per call: callers adjust the context in place
+    emotion, intent = _SHORT_REPLIES.get(text) or _detect(text)
+    return {"emotion": emotion, "intent": intent}
+
 
-    # Negation-aware emotion adjustments (e.g., "not happy" -> negative)
-    positive_terms = [
-        "happy", "good", "great", "excited", "okay", "ok", "fine", "positive", "calm", "content"
-    ]
-    negative_terms = [
-        "sad", "down", "depressed", "anxious", "angry", "stressed", "worried", "upset"
-    ]
-
-    def _has_negated(terms: list[str]) -> bool:
-        # Patterns: not X, not so X, not that X, not feeling X, don't feel X, do not feel X, no longer X
-        for t in terms:
-            patterns = [
-                rf"\bnot (?:so |that )?{re.escape(t)}\b",
-                rf"\bnot feeling (?:so |that )?{re.escape(t)}\b",
-                rf"\bdon't feel (?:so |that )?{re.escape(t)}\b",
-                rf"\bdo not feel (?:so |that )?{re.escape(t)}\b",
-                rf"\bno longer (?:feel(?:ing)? )?{re.escape(t)}\b",
-            ]
-            for p in patterns:
-                if re.search(p, text):
-                    return True
-        return False
-
-    # Base emotion from TextBlob
+# Bounded LRU of normalized text -> (emotion, intent); lru_cache is safe to
+# share across Streamlit's per-session script threads
+@functools.lru_cache(maxsize=1024)
+def _detect(text: str) -> tuple[str, str]:
+    # Base emotion from the sentiment lexicon
     emotion = get_emotion(text)
     # Override with negation logic where applicable
-    if _has_negated(positive_terms):
+    if _NEG_POS_RE.search(text):
         emotion = "negative"
-    elif _has_negated(negative_terms):
+    elif _NEG_NEG_RE.search(text):
         # Flip strong negatives to neutral when negated
         emotion = "neutral"
 
-    if _contains_any(text, [
-        "i made", "i built", "i created", "i achieved", "i accomplished",
-        "promotion", "got hired", "won", "passed", "nailed it",
-        "big achievement", "proud of", "shipped"
-    ]):
-        intent = "achievement"
-    elif _contains_any(text, ["thank you", "thanks", "appreciate it", "grateful"]):
-        intent = "gratitude"
-    elif _contains_any(text, ["sorry", "apologies", "my fault", "apologize"]):
-        intent = "apology"
-    elif _contains_any(text, ["angry", "mad", "furious", "pissed", "rage"]):
-        intent = "anger"
-    elif _contains_any(text, ["tired", "exhausted", "drained", "fatigued", "sleepy", "burnt out", "burned out"]):
-        intent = "tiredness"
-    elif _contains_any(text, ["overwhelmed", "too much", "can’t handle", "cant handle", "overloaded"]):
-        intent = "overwhelm"
-    elif _contains_any(text, ["confused", "don’t know", "dont know", "unsure", "uncertain"]):
-        intent = "confusion"
-    elif _contains_any(text, ["lonely", "alone", "isolated"]):
-        intent = "loneliness"
-    elif _contains_any(text, ["anxious", "anxiety", "worried", "stress", "stressed"]):
-        intent = "anxiety"
-    elif "journal" in text or _contains_any(text, ["write", "diary", "journaling", "notes"]):
-        intent = "journal"
-    elif _contains_any(text, ["breathe", "breathing", "grounding", "relax", "calm down"]):
-        intent = "breathing"
-    elif _contains_any(text, ["who are you", "what are you", "what can you do", "help me", "how can you help", "what can i do"]):
-        intent = "capability"
-    elif _contains_any(text, ["hello", "hi", "hey", "good morning", "good evening", "good afternoon"]):
-        intent = "greet"
-    else:
-        intent = "none"
+    intent = _match_intent(text)
+
+    return emotion, intent
 
-    return {"emotion": emotion, "intent": intent}
 
+# Very common short messages resolved without a cache lookup; built from
+# _detect at import so the table cannot drift from the pipeline
+_SHORT_REPLIES: dict[str, tuple[str, str]] = {
+    text: _detect(text) for text in ("", "hi", "hey", "hello", "ok", "okay", "thanks", "thank you")
+}
 
-def get_response(user_input: str) -> str:
+
+def get_response(user_input: str, ctx: dict | None = None) -> str:
+    """Rule-based reply. Pass ``ctx`` to reuse an existing detect_intent_and_emotion result."""
     if not user_input or not user_input.strip():
         return "I'm here to listen. How are you feeling today?"
 
     text = user_input.lower()
-    ctx = detect_intent_and_emotion(text)
+    if ctx is None:
+        ctx = detect_intent_and_emotion(text)
     emotion = ctx["emotion"]
 
     # Highly specific intents first
@@ -177,15 +366,26 @@ def llm_available() -> bool:
     return bool(os.getenv("OLLAMA_BASE_URL", "http://localhost:11434"))
 
 
+# Configuration is read once per process; the OpenAI client and the Ollama
+# HTTP session are reused so each turn skips client/TLS/TCP setup.
+_LLM_AVAILABLE = llm_available()
+_USE_OPENAI = bool(os.getenv("OPENAI_API_KEY") and OpenAI is not None)
+_OLLAMA_SESSION = requests.Session()
+
+
+@functools.cache
+def _openai_client():
+    return OpenAI()
+
+
 def get_llm_response(user_input: str, history: list[dict] | None = None, style: str = "concise") -> str | None:
     """Return an LLM-generated response if configured, else None.
 
     Expects history as a list of {"role": "user"|"assistant", "content": str}.
     """
-    if not llm_available():
+    if not _LLM_AVAILABLE:
         return None
-    openai_key = os.getenv("OPENAI_API_KEY")
-    use_openai = bool(openai_key and OpenAI is not None)
+    use_openai = _USE_OPENAI
     model = os.getenv("OPENAI_MODEL", "gpt-4o-mini") if use_openai else os.getenv("OLLAMA_MODEL", "llama3.2")
 
     if style == "detailed":
@@ -217,7 +417,7 @@ def get_llm_response(user_input: str, history: list[dict] | None = None, style:
 
     try:
         if use_openai:
-            client = OpenAI()
+            client = _openai_client()
             resp = client.chat.completions.create(
                 model=model,
                 messages=messages,
@@ -237,9 +437,11 @@ def get_llm_response(user_input: str, history: list[dict] | None = None, style:
                     "temperature": float(os.getenv("OLLAMA_TEMPERATURE", "0.7"))
                 }
             }
-            r = requests.post(url, json=payload, timeout=60)
+            r = _OLLAMA_SESSION.post(
+                url, data=_json_dumps(payload), headers={"Content-Type": "application/json"}, timeout=60
+            )
             r.raise_for_status()
-            data = r.json()
+            data = _json_loads(r.content)
             # Ollama returns {message:{role, content}}
             content = data.get("message", {}).get("content") or data.get("response")
             return content.strip() if content else None
@@ -247,9 +449,15 @@ def get_llm_response(user_input: str, history: list[dict] | None = None, style:
         return None
 
 
-def generate_reply(user_input: str, history: list[dict] | None = None, style: str = "concise") -> str:
-    """Unified reply generator: prefer LLM if available, else rule-based."""
+def generate_reply(
+    user_input: str, history: list[dict] | None = None, style: str = "concise", ctx: dict | None = None
+) -> str:
+    """Unified reply generator: prefer LLM if available, else rule-based.
+
+    ``ctx`` is an already computed detect_intent_and_emotion result, forwarded
+    to the rule-based fallback so it is not recomputed.
+    """
     llm = get_llm_response(user_input, history, style=style)
     if llm:
         return llm
-    return get_response(user_input)
\ No newline at end of file
+    return get_response(user_input, ctx=ctx)
\ No newline at end of file
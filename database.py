@@ -1,37 +1,150 @@
 # database.py
+import atexit
+import functools
+import os
+import queue
 import sqlite3
+import threading
+from contextlib import contextmanager
 
 DB_PATH = "database.db"
 
-def get_db_connection():
-    conn = sqlite3.connect(DB_PATH)
+# Numeric mood stored alongside the label in mood_signals.mood_value
+MOOD_VALUES = {"positive": 1, "neutral": 0, "negative": -1}
+
+# journal_mode=WAL is persisted in the database header, so it only needs to be
+# set once per process; the remaining PRAGMAs are per-connection.
+_wal_set = False
+
+# Process-wide connections reused across Streamlit reruns: a single writer
+# (serialized through WRITE_LOCK) plus a small pool of readers.
+WRITE_LOCK = threading.Lock()
+_WRITER = None
+_READERS = queue.Queue()
+_READER_POOL_SIZE = os.cpu_count() or 4
+_readers_opened = 0
+_pool_lock = threading.Lock()
+
+
+def _configure(conn):
+    global _wal_set
     conn.row_factory = sqlite3.Row
+    if not _wal_set:
+        conn.execute("PRAGMA journal_mode=WAL")
+        _wal_set = True
+    conn.executescript(
+        "PRAGMA synchronous=NORMAL;"
+        "PRAGMA temp_store=MEMORY;"
+        "PRAGMA cache_size=-20000;"
+        "PRAGMA busy_timeout=5000;"
+    )
     return conn
 
+
+def get_db_connection():
+    return _configure(sqlite3.connect(DB_PATH))
+
+
+def get_writer():
+    """Return the shared autocommit writer connection.
+
+    Callers must hold WRITE_LOCK while using it.
+    """
+    global _WRITER
+    if _WRITER is None:
+        with _pool_lock:
+            if _WRITER is None:
+                _WRITER = _configure(
+                    sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None)
+                )
+    return _WRITER
+
+
+@contextmanager
+def get_reader():
+    """Borrow a pooled read connection and return it to the pool afterwards."""
+    global _readers_opened
+    try:
+        conn = _READERS.get_nowait()
+    except queue.Empty:
+        with _pool_lock:
+            can_open = _readers_opened < _READER_POOL_SIZE
+            if can_open:
+                _readers_opened += 1
+        if can_open:
+            conn = _configure(sqlite3.connect(DB_PATH, check_same_thread=False))
+        else:
+            conn = _READERS.get()
+    try:
+        yield conn
+    finally:
+        _READERS.put(conn)
+
+
+@atexit.register
+def close_pool():
+    global _WRITER, _readers_opened
+    if _WRITER is not None:
+        _WRITER.close()
+        _WRITER = None
+    while True:
+        try:
+            _READERS.get_nowait().close()
+        except queue.Empty:
+            break
+    _readers_opened = 0
+
+
+# Streamlit reruns app.py (and so init_db) on every interaction; the DDL only
+# needs to run once per process.
+@functools.cache
 def init_db():
     conn = get_db_connection()
-    conn.execute(
-        """
-        CREATE TABLE IF NOT EXISTS journal_entries (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            date TEXT NOT NULL,
-            content TEXT NOT NULL,
-            mood TEXT NOT NULL,
-            polarity REAL NOT NULL
+    # Hold the write lock from the schema check through the migration: two
+    # sessions starting together on an old database would otherwise both see
+    # mood_value missing, and the second ALTER TABLE fails on a duplicate column.
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS journal_entries (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                date TEXT NOT NULL,
+                content TEXT NOT NULL,
+                mood TEXT NOT NULL,
+                polarity REAL NOT NULL
+            )
+            """
         )
-        """
-    )
-    conn.execute(
-        """
-        CREATE TABLE IF NOT EXISTS mood_signals (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            date TEXT NOT NULL,
-            source TEXT NOT NULL,
-            content TEXT NOT NULL,
-            mood TEXT NOT NULL,
-            polarity REAL NOT NULL
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS mood_signals (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                date TEXT NOT NULL,
+                source TEXT NOT NULL,
+                content TEXT NOT NULL,
+                mood TEXT NOT NULL,
+                polarity REAL NOT NULL,
+                mood_value INTEGER
+            )
+            """
         )
-        """
-    )
-    conn.commit()
-    conn.close()
\ No newline at end of file
+        # Older databases predate mood_value: add it and backfill from the label
+        columns = {row["name"] for row in conn.execute("PRAGMA table_info(mood_signals)")}
+        if "mood_value" not in columns:
+            conn.execute("ALTER TABLE mood_signals ADD COLUMN mood_value INTEGER")
+        conn.execute(
+            "UPDATE mood_signals SET mood_value = "
+            "CASE LOWER(mood) WHEN 'positive' THEN 1 WHEN 'negative' THEN -1 ELSE 0 END "
+            "WHERE mood_value IS NULL"
+        )
+        # Filtered Mood Trends (WHERE source IN ... ORDER BY date) and the Journal
+        # "recent entries" preview (ORDER BY date DESC LIMIT 5).
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_mood_source_date ON mood_signals(source, date)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_journal_date ON journal_entries(date DESC)")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
\ No newline at end of file
@@ -17,12 +17,23 @@ project.
 
 from __future__ import annotations
 
+import functools
 import re
-from typing import Tuple
+from collections import Counter
+from typing import Iterable, List, Tuple
+
+# Optional Aho-Corasick matcher for batch analysis; falls back to the
+# per-entry tokenizer when pyahocorasick is not installed.
+try:
+    import ahocorasick  # type: ignore
+except Exception:  # pragma: no cover
+    ahocorasick = None  # type: ignore
 
 # Curated lists of positive and negative words. These lists are not
 # exhaustive but cover common emotions relevant for our mini project.
-POSITIVE_WORDS = {
+# They are frozensets so the lexicons (and the sets derived from them
+# below) cannot drift at runtime.
+POSITIVE_WORDS = frozenset({
     "happy",
     "joy",
     "joyful",
@@ -36,9 +47,9 @@ POSITIVE_WORDS = {
     "fortunate",
     "grateful",
     "calm",
-}
+})
 
-NEGATIVE_WORDS = {
+NEGATIVE_WORDS = frozenset({
     "sad",
     "depressed",
     "down",
@@ -53,9 +64,26 @@ NEGATIVE_WORDS = {
     "fear",
     "lonely",
     "hopeless",
-}
+})
+
+ALL_MOOD_WORDS = POSITIVE_WORDS | NEGATIVE_WORDS
+
+# The mood lexicons are plain ASCII words, so a simple letter run is enough
+# to tokenize the lowercased entry.
+_TOKEN_RE = re.compile(r"[a-z]+")
 
+# ASCII fast path: most entries are plain ASCII, so instead of building a
+# token list we fold the bytes in one translate (A-Z -> a-z, everything else
+# -> space), double the spaces so adjacent words each keep their own
+# delimiters, and count " word " occurrences with bytes.count (memmem in C).
+_ASCII_FOLD = bytes(
+    c + 32 if 0x41 <= c <= 0x5A else c if 0x61 <= c <= 0x7A else 0x20 for c in range(256)
+)
+_POSITIVE_PADDED = tuple(f" {w} ".encode("ascii") for w in POSITIVE_WORDS)
+_NEGATIVE_PADDED = tuple(f" {w} ".encode("ascii") for w in NEGATIVE_WORDS)
 
+
+@functools.lru_cache(maxsize=4096)
 def analyze_emotion(entry_text: str) -> Tuple[str, float]:
     """
     Analyze a journal entry and return the mood and basic polarity.
@@ -74,11 +102,28 @@ def analyze_emotion(entry_text: str) -> Tuple[str, float]:
             positive words were found, ‑1.0 indicates only negative
             words, and 0.0 indicates no words from either list were
             found or equal amounts of both.
+
+    Results are memoized per entry text (see ``analyze_emotion.cache_clear``)
+    since the same entries are often scored again.
     """
+    if entry_text.isascii():
+        padded = b" " + entry_text.encode("ascii").translate(_ASCII_FOLD).replace(b" ", b"  ") + b" "
+        pos_count = sum(padded.count(w) for w in _POSITIVE_PADDED)
+        neg_count = sum(padded.count(w) for w in _NEGATIVE_PADDED)
+        return _score(pos_count, neg_count)
+
     # Lowercase and tokenize the entry into words
-    tokens = re.findall(r"\b\w+\b", entry_text.lower())
-    pos_count = sum(1 for token in tokens if token in POSITIVE_WORDS)
-    neg_count = sum(1 for token in tokens if token in NEGATIVE_WORDS)
+    tokens = _TOKEN_RE.findall(entry_text.lower())
+    # Count every token once, then only look up the mood words present
+    counts = Counter(tokens)
+    present = ALL_MOOD_WORDS & counts.keys()
+    pos_count = sum(counts[w] for w in present & POSITIVE_WORDS)
+    neg_count = sum(counts[w] for w in present & NEGATIVE_WORDS)
+    return _score(pos_count, neg_count)
+
+
+def _score(pos_count: int, neg_count: int) -> Tuple[str, float]:
+    """Turn positive/negative word counts into a (mood, polarity) pair."""
     total = pos_count + neg_count
 
     # Compute a simple polarity score
@@ -95,4 +140,153 @@ def analyze_emotion(entry_text: str) -> Tuple[str, float]:
     else:
         mood = "neutral"
 
-    return mood, polarity
\ No newline at end of file
+    return mood, polarity
+
+
+def _build_mood_automaton():
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for word in POSITIVE_WORDS:
+        automaton.add_word(word, (len(word), 1))
+    for word in NEGATIVE_WORDS:
+        automaton.add_word(word, (len(word), -1))
+    automaton.make_automaton()
+    return automaton
+
+
+_MOOD_AUTOMATON = _build_mood_automaton()
+
+
+def _is_letter(ch: str) -> bool:
+    return "a" <= ch <= "z"
+
+
+def analyze_emotions_batch(entries: Iterable[str]) -> List[Tuple[str, float]]:
+    """
+    Analyze many journal entries, e.g. when re-scoring the archive.
+
+    With pyahocorasick installed, each entry is scanned once by an
+    automaton over the mood vocabulary instead of being tokenized; a hit
+    only counts when it is a whole word, which gives the same result as
+    analyze_emotion. Without it, this simply maps analyze_emotion.
+
+    Args:
+        entries: Journal entry texts.
+
+    Returns:
+        List[Tuple[str, float]]: One (mood, polarity) pair per entry, in
+            input order.
+    """
+    if _MOOD_AUTOMATON is None:
+        return [analyze_emotion(entry) for entry in entries]
+
+    results = []
+    for entry in entries:
+        text = entry.lower()
+        last = len(text) - 1
+        pos_count = neg_count = 0
+        for end, (length, delta) in _MOOD_AUTOMATON.iter(text):
+            start = end - length + 1
+            # Reject matches inside longer words ("sad" in "crusade")
+            if (start > 0 and _is_letter(text[start - 1])) or (end < last and _is_letter(text[end + 1])):
+                continue
+            if delta > 0:
+                pos_count += 1
+            else:
+                neg_count += 1
+        results.append(_score(pos_count, neg_count))
+    return results
+
+
+_FNV_OFFSET = 0xCBF29CE484222325
+_FNV_PRIME = 0x100000001B3
+
+
+def _fnv1a64(word: bytes) -> int:
+    h = _FNV_OFFSET
+    for c in word:
+        h = ((h ^ c) * _FNV_PRIME) & 0xFFFFFFFFFFFFFFFF
+    return h
+
+
+@functools.cache
+def _mood_hash_kernel():
+    """
+    Import Numba and build the hash-scanning kernel on first use.
+
+    Numba (and NumPy) take ~100 ms and tens of MB to import, so this is
+    deferred until analyze_emotion_fast is actually called instead of
+    paying it on every ``import journal``.
+
+    Returns:
+        (kernel, np, pos_hashes, neg_hashes), or None without Numba.
+    """
+    # Optional Numba JIT for analyze_emotion_fast; falls back to analyze_emotion
+    try:
+        import numpy as np  # type: ignore
+        from numba import njit  # type: ignore
+    except Exception:  # pragma: no cover
+        return None
+
+    pos_hashes = np.sort(np.array([_fnv1a64(w.encode("ascii")) for w in POSITIVE_WORDS], dtype=np.uint64))
+    neg_hashes = np.sort(np.array([_fnv1a64(w.encode("ascii")) for w in NEGATIVE_WORDS], dtype=np.uint64))
+
+    @njit(cache=True)
+    def _count_mood_hashes(buf, pos_hashes, neg_hashes):
+        # Walk [A-Za-z]+ runs, FNV-1a hash each (lowercased) in place and
+        # binary-search the sorted lexicon hashes.
+        pos_count = 0
+        neg_count = 0
+        n = buf.shape[0]
+        i = 0
+        while i < n:
+            c = buf[i]
+            if not (65 <= c <= 90 or 97 <= c <= 122):
+                i += 1
+                continue
+            h = np.uint64(0xCBF29CE484222325)
+            while i < n:
+                c = buf[i]
+                if 65 <= c <= 90:
+                    c += 32
+                elif not 97 <= c <= 122:
+                    break
+                h = (h ^ np.uint64(c)) * np.uint64(0x100000001B3)
+                i += 1
+            j = np.searchsorted(pos_hashes, h)
+            if j < pos_hashes.shape[0] and pos_hashes[j] == h:
+                pos_count += 1
+            else:
+                j = np.searchsorted(neg_hashes, h)
+                if j < neg_hashes.shape[0] and neg_hashes[j] == h:
+                    neg_count += 1
+        return pos_count, neg_count
+
+    return _count_mood_hashes, np, pos_hashes, neg_hashes
+
+
+def analyze_emotion_fast(entry_bytes: bytes) -> Tuple[str, float]:
+    """
+    Analyze a UTF-8 encoded journal entry with a Numba-compiled scanner.
+
+    Intended for bulk re-analysis of archived entries: the first call pays
+    the JIT compilation (cached on disk afterwards), so single entries are
+    better served by analyze_emotion. The kernel only folds ASCII letters,
+    so non-ASCII entries (whose lowercasing can produce ASCII letters, e.g.
+    "İ") are decoded and passed to analyze_emotion, as is everything when
+    Numba is not installed.
+
+    Args:
+        entry_bytes: The journal entry, UTF-8 encoded.
+
+    Returns:
+        Tuple[str, float]: Same (mood, polarity) pair as analyze_emotion.
+    """
+    kernel = _mood_hash_kernel()
+    if kernel is None or not entry_bytes.isascii():
+        return analyze_emotion(entry_bytes.decode("utf-8", "replace"))
+    count_mood_hashes, np, pos_hashes, neg_hashes = kernel
+    buf = np.frombuffer(entry_bytes, dtype=np.uint8)
+    pos_count, neg_count = count_mood_hashes(buf, pos_hashes, neg_hashes)
+    return _score(pos_count, neg_count)
\ No newline at end of file
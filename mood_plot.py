@@ -12,77 +12,208 @@ The plot uses Matplotlib and assigns numeric values to moods for
 consistency: positive = 1, neutral = 0, negative = -1. Dates are
 displayed on the x-axis, and mood values on the y-axis. If no data
 exists yet, the function will skip chart creation and return None.
+
+Charts are rendered headlessly through Matplotlib's object-oriented API
+(a `Figure` attached to a `FigureCanvasAgg`) rather than pyplot, so no
+GUI backend is probed and no pyplot global state is involved. Keep it
+that way: importing pyplot here would reintroduce backend selection.
 """
 
 import os
-import sqlite3
-from typing import Optional
+import threading
+from typing import List, Optional
+
+import numpy as np
+
+from database import get_reader
+
+# A single Agg-backed figure reused across renders of both charts. Building
+# a new figure (and going through pyplot's global state) dominates the cost
+# of these small charts, so we clear and redraw the same axes instead.
+# Matplotlib is not thread-safe and Streamlit serves sessions from multiple
+# threads, hence the lock. Matplotlib itself is only imported, and the
+# figure built, on the first render (see _init_figure), so importing this
+# module stays cheap for pages that never plot.
+_FIG = None
+_AX = None
+_CANVAS = None
+_FIG_LOCK = threading.Lock()
+# tight_layout is computed on the first render only: every chart has the same
+# labels and fixed-width date ticks (_DATE_FMT), so the margins do not change.
+_layout_done = False
+_DATE_FMT = None
+
+# Sticky result of the sqlite_master probe for the mood_signals table
+_has_mood_signals = False
+
+# SQL expression mapping a mood label to its numeric value
+_MOOD_VALUE_SQL = "CASE LOWER(mood) WHEN 'positive' THEN 1 WHEN 'negative' THEN -1 ELSE 0 END"
+
+# mood_signals.mood_value is nullable and init_db backfills it only once per
+# process, so rows written without it fall back to the label mapping
+_SIGNAL_VALUE_SQL = f"COALESCE(mood_value, {_MOOD_VALUE_SQL})"
+
+# Set once the static directory has been created, to skip the syscall after
+_static_ready = False
 
-import matplotlib.pyplot as plt
+# Fingerprint of the data behind the last mood_trend.png render
+_CACHE = {"fingerprint": None, "path": None}
 
 
 def _ensure_static_dir() -> str:
     """Ensure that the static directory exists and return its path."""
+    global _static_ready
     static_dir = "static"
-    if not os.path.isdir(static_dir):
-        os.makedirs(static_dir)
+    if not _static_ready:
+        os.makedirs(static_dir, exist_ok=True)
+        _static_ready = True
     return static_dir
 
 
+def _init_figure() -> None:
+    """Import Matplotlib and build the shared figure; call with _FIG_LOCK held."""
+    global _FIG, _AX, _CANVAS, _DATE_FMT
+    if _FIG is not None:
+        return
+    import matplotlib.dates as mdates
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    _FIG = Figure(figsize=(8, 4))
+    _AX = _FIG.add_subplot(111)
+    _CANVAS = FigureCanvasAgg(_FIG)
+    _DATE_FMT = mdates.DateFormatter("%Y-%m-%d %H:%M")
+
+
+def _render(dates, mood_values, title: str, chart_filename: str) -> str:
+    """Draw the trend on the shared figure, save it and return its relative path.
+
+    The line is a single LineCollection over precomputed segments, with the
+    point markers drawn as one scatter, so large histories are drawn in two
+    batched artists rather than a per-point Line2D path.
+    """
+    global _layout_done
+    chart_path = os.path.join(_ensure_static_dir(), chart_filename)
+    with _FIG_LOCK:
+        _init_figure()
+        import matplotlib.dates as mdates
+        from matplotlib.collections import LineCollection
+
+        # One vectorized parse of the "YYYY-MM-DD HH:MM:SS" strings, then a
+        # single date2num over the datetime64 array
+        x = mdates.date2num(np.asarray(dates, dtype="datetime64[s]"))
+        y = np.asarray(mood_values, dtype=float)
+        segments = np.column_stack([x[:-1], y[:-1], x[1:], y[1:]]).reshape(-1, 2, 2)
+
+        _AX.cla()
+        _AX.add_collection(LineCollection(segments, linewidths=1.5))
+        _AX.scatter(x, y, s=36, zorder=3)
+        _AX.xaxis_date()
+        _AX.xaxis.set_major_formatter(_DATE_FMT)
+        _AX.set_title(title)
+        _AX.set_xlabel("Date")
+        _AX.set_ylabel("Mood Value (positive=1, neutral=0, negative=-1)")
+        _AX.tick_params(axis="x", labelrotation=45)
+        _AX.grid(True, which="major", linestyle="--", linewidth=0.5)
+        if not _layout_done:
+            _FIG.tight_layout()
+            _layout_done = True
+        _CANVAS.print_png(chart_path)
+    return os.path.join("static", chart_filename)
+
+
+def _mood_signals_exists(conn) -> bool:
+    """Return whether the mood_signals table exists, probing until it does."""
+    global _has_mood_signals
+    if not _has_mood_signals:
+        _has_mood_signals = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='mood_signals'"
+        ).fetchone() is not None
+    return _has_mood_signals
+
+
 def plot_mood_trend() -> Optional[str]:
     """
     Generate a mood trend chart from the journal database.
 
-    Reads all entries from the `journal_entries` table, converts the
-    moods to numeric values, and plots them against their dates. The
-    image is saved as mood_trend.png in the static directory. If there
-    are no journal entries, returns None.
+    Reads all signals from the `mood_signals` table (or, if it is missing
+    or empty, the `journal_entries` table), converts the moods to numeric
+    values, and plots them against their dates. The image is saved as
+    mood_trend.png in the static directory. If there is no data yet,
+    returns None.
+
+    The chart is only re-rendered when the data changes: a (table, row
+    count, latest date) fingerprint is compared with the previous render
+    and the existing image is returned when they match.
 
     Returns:
         Optional[str]: The relative path to the saved image, or None if
             no chart was generated.
     """
-    conn = sqlite3.connect("database.db")
-    cur = conn.cursor()
-    # Prefer unified mood_signals if present, else fallback to journal_entries
-    try:
-        cur.execute("SELECT date, mood FROM mood_signals ORDER BY date ASC")
-        rows = cur.fetchall()
-        if not rows:
-            raise ValueError("empty mood_signals")
-    except Exception:
-        cur.execute("SELECT date, mood FROM journal_entries ORDER BY date ASC")
-        rows = cur.fetchall()
-    conn.close()
+    with get_reader() as conn:
+        # One read transaction, so the row count used to size the arrays and
+        # the rows streamed below come from the same snapshot
+        conn.execute("BEGIN")
+        try:
+            # Prefer unified mood_signals if present, else fallback to journal_entries
+            table = None
+            if _mood_signals_exists(conn):
+                table = "mood_signals"
+                count, latest = conn.execute("SELECT COUNT(*), COALESCE(MAX(date), '') FROM mood_signals").fetchone()
+            if table is None or count == 0:
+                table = "journal_entries"
+                count, latest = conn.execute("SELECT COUNT(*), COALESCE(MAX(date), '') FROM journal_entries").fetchone()
+            if count == 0:
+                # No data yet; skip chart creation
+                return None
+
+            fingerprint = (table, count, latest)
+            if fingerprint == _CACHE["fingerprint"] and os.path.exists(_CACHE["path"]):
+                return _CACHE["path"]
+
+            # mood_signals stores mood_value at insert time; journal_entries only
+            # has the label, which SQLite maps to a number in the query itself.
+            # Rows are streamed from the cursor into preallocated arrays rather
+            # than materialized with fetchall().
+            value = _SIGNAL_VALUE_SQL if table == "mood_signals" else _MOOD_VALUE_SQL
+            dates = np.empty(count, dtype="datetime64[s]")
+            mood_values = np.empty(count, dtype=np.int8)
+            for i, (date, mood_value) in enumerate(conn.execute(f"SELECT date, {value} FROM {table} ORDER BY date ASC")):
+                dates[i] = date
+                mood_values[i] = mood_value
+        finally:
+            conn.execute("COMMIT")
+
+    path = _render(dates, mood_values, "Mood Trend Over Time", "mood_trend.png")
+    _CACHE["fingerprint"], _CACHE["path"] = fingerprint, path
+    return path
+
+
+def plot_filtered_mood_trend(sources: List[str]) -> Optional[str]:
+    """
+    Generate a mood trend chart restricted to the given signal sources.
+
+    Reads `mood_signals` rows whose source is in `sources` (e.g. "chat",
+    "journal") and renders them on the shared module-level figure. The
+    image is saved as mood_trend_filtered.png in the static directory.
+
+    Args:
+        sources: Signal sources to include.
+
+    Returns:
+        Optional[str]: The relative path to the saved image, or None if
+            there is no data for the selected sources.
+    """
+    qmarks = ",".join(["?"] * len(sources)) or "?"
+    with get_reader() as conn:
+        rows = conn.execute(
+            f"SELECT date, {_SIGNAL_VALUE_SQL} FROM mood_signals WHERE source IN ({qmarks}) ORDER BY date ASC",
+            sources,
+        ).fetchall()
 
     if not rows:
-        # No data yet; skip chart creation
         return None
 
-    dates = [row[0] for row in rows]
-    mood_values = []
-    for _, mood in rows:
-        if mood.lower() == "positive":
-            mood_values.append(1)
-        elif mood.lower() == "negative":
-            mood_values.append(-1)
-        else:
-            mood_values.append(0)
-
-    # Create a new figure and plot the data
-    plt.figure(figsize=(8, 4))
-    plt.plot(dates, mood_values, marker="o", linestyle="-", linewidth=1.5)
-    plt.title("Mood Trend Over Time")
-    plt.xlabel("Date")
-    plt.ylabel("Mood Value (positive=1, neutral=0, negative=-1)")
-    plt.xticks(rotation=45)
-    plt.grid(True, which="major", linestyle="--", linewidth=0.5)
-    plt.tight_layout()
-
-    static_dir = _ensure_static_dir()
-    chart_filename = "mood_trend.png"
-    chart_path = os.path.join(static_dir, chart_filename)
-    plt.savefig(chart_path)
-    plt.close()
-
-    return os.path.join("static", chart_filename)
\ No newline at end of file
+    dates = [r[0] for r in rows]
+    vals = np.fromiter((r[1] for r in rows), dtype=np.int8, count=len(rows))
+    return _render(dates, vals, "Mood Trend (Filtered)", "mood_trend_filtered.png")
\ No newline at end of file
@@ -11,10 +11,25 @@ psychiatric care.
 The `get_suggestion` function accepts a mood label ("positive",
 "negative", "neutral") and returns a string with an appropriate
 suggestion. Additional mood types can be added by extending the
-dictionary below.
+`SUGGESTIONS` dictionary below.
 """
 
 
+SUGGESTIONS = {
+    "positive": (
+        "Keep up the positive energy! Consider writing down three things you're grateful for."
+    ),
+    "negative": (
+        "It might help to take a few deep breaths or go for a short walk. Reflect on what made you feel this way."
+    ),
+    "neutral": (
+        "Perhaps try a short meditation or note one thing that went well today."
+    ),
+}
+
+DEFAULT_SUGGESTION = "Take a moment to reflect on how you're feeling and write about it."
+
+
 def get_suggestion(mood: str) -> str:
     """
     Provide a helpful suggestion based on the mood.
@@ -25,15 +40,9 @@ def get_suggestion(mood: str) -> str:
     Returns:
         str: A user‑friendly suggestion string.
     """
-    suggestions = {
-        "positive": (
-            "Keep up the positive energy! Consider writing down three things you're grateful for."
-        ),
-        "negative": (
-            "It might help to take a few deep breaths or go for a short walk. Reflect on what made you feel this way."
-        ),
-        "neutral": (
-            "Perhaps try a short meditation or note one thing that went well today."
-        ),
-    }
-    return suggestions.get(mood.lower(), "Take a moment to reflect on how you're feeling and write about it.")
\ No newline at end of file
+    # analyze_emotion already returns canonical lowercase labels, so only
+    # fall back to lowercasing when the direct lookup misses.
+    suggestion = SUGGESTIONS.get(mood)
+    if suggestion is None:
+        suggestion = SUGGESTIONS.get(mood.lower(), DEFAULT_SUGGESTION)
+    return suggestion
\ No newline at end of file
@@ -0,0 +1,72 @@
+import pytest
+
+from chatbot import (
+    NEG_THRESHOLD,
+    POS_THRESHOLD,
+    _SHORT_REPLIES,
+    _detect,
+    _question_like,
+    detect_intent_and_emotion,
+    get_emotion,
+)
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["i'm very sad", "I am really tired", "I feel really angry", "I'm not very happy"],
+)
+def test_modifiers_do_not_dilute_emotion(text):
+    assert get_emotion(text) == "negative"
+    assert detect_intent_and_emotion(text)["emotion"] == "negative"
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "i'm very sad",
+        "I'm not very happy",
+        "really not good",
+        "not a good day",
+        "I don't feel great today",
+        "what a wonderful, lovely day!!",
+        "this is terribly boring",
+        "extremely good",
+        "that was not nice",
+        "never nice",
+        "this sucks",
+        "kinda sucks",
+        ":)",
+        "thanks :)",
+        "<3",
+        "I feel :(",
+        "ok :(",
+        "great :D",
+    ],
+)
+def test_emotion_matches_textblob(text):
+    textblob = pytest.importorskip("textblob")
+    polarity = textblob.TextBlob(text).sentiment.polarity
+    expected = "positive" if polarity > POS_THRESHOLD else "negative" if polarity < NEG_THRESHOLD else "neutral"
+    assert get_emotion(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("how\nare you", True),
+        ("what\tnow", True),
+        ("how-to fix this", True),
+        ("can-do attitude", True),
+        ("what's up", True),
+        ("whatever", False),
+        ("isn't it", False),
+    ],
+)
+def test_question_like_first_word(text, expected):
+    assert _question_like(text) is expected
+
+
+def test_short_replies_match_detect():
+    for text, expected in _SHORT_REPLIES.items():
+        assert _detect.__wrapped__(text) == expected
+        assert detect_intent_and_emotion(text.upper()) == dict(zip(("emotion", "intent"), expected))
@@ -0,0 +1,59 @@
+import random
+
+import pytest
+
+from journal import NEGATIVE_WORDS, POSITIVE_WORDS, analyze_emotion, analyze_emotion_fast, analyze_emotions_batch
+
+
+def _mixed_corpus(n=2000, seed=0):
+    words = sorted(POSITIVE_WORDS | NEGATIVE_WORDS) + [
+        "the", "HAPPY", "Sad.", "sad,sad", "crusade", "unhappy", "downtown",
+        "joyful", "don't", "café", "naïve", "İ", "happyİsad", "ßad", "1",
+    ]
+    rng = random.Random(seed)
+    return [
+        "".join(rng.choice(words) + rng.choice([" ", "  ", ",", ". ", "!", "\n", ""]) for _ in range(rng.randint(0, 10)))
+        for _ in range(n)
+    ]
+
+
+def test_analyze_emotion_fast_matches_analyze_emotion():
+    pytest.importorskip("numba")
+    assert analyze_emotion_fast("happyİsad".encode()) == analyze_emotion("happyİsad")
+    for text in _mixed_corpus():
+        assert analyze_emotion_fast(text.encode()) == analyze_emotion(text), text
+
+
+def test_analyze_emotions_batch_matches_analyze_emotion():
+    texts = _mixed_corpus(seed=1) + [
+        "",
+        "crusade unhappy downtown joyful",
+        "joy, sad! happy.sad",
+        "Happy happy joy joy",
+        "café triste, naïve happiness İsad",
+    ]
+    assert analyze_emotions_batch(texts) == [analyze_emotion(t) for t in texts]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "happy happy",
+        "sad,sad",
+        "don't",
+        "Happy  SAD\thappy\nsad",
+        "happy-sad.happy",
+        "unhappy crusade joyful",
+        "",
+        " happy ",
+    ],
+)
+def test_analyze_emotion_ascii_branch_matches_tokenizer(text):
+    # A trailing "é" forces the regex tokenizer without adding a word
+    assert analyze_emotion.__wrapped__(text) == analyze_emotion.__wrapped__(text + "é")
+
+
+def test_analyze_emotion_ascii_branch_matches_tokenizer_on_corpus():
+    for text in _mixed_corpus(seed=2):
+        if text.isascii():
+            assert analyze_emotion.__wrapped__(text) == analyze_emotion.__wrapped__(text + "é"), text